@@ -7,18 +7,42 @@ Author: Abhay
 Purpose: Learning Data Quality Testing - Automated Data Integrity Protocol
 """
 
-import csv
+import argparse
 import os
 from datetime import datetime, timedelta
 
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, 'data'))
 
-def generate_sales_log():
+
+def write_dataset(records, data_dir, name, fmt='parquet'):
+    """
+    Writes header + rows to data_dir/<name>.parquet (zstd) or <name>.csv.
+    Returns: path of the written file
+    """
+    if fmt == 'csv':
+        filepath = os.path.join(data_dir, f'{name}.csv')
+        payload = "\n".join(",".join(map(str, row)) for row in records) + "\n"
+        with open(filepath, 'w', newline='', buffering=1 << 16) as f:
+            f.write(payload)
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        header, *rows = records
+        table = pa.Table.from_arrays([pa.array(col) for col in zip(*rows)], names=header)
+        filepath = os.path.join(data_dir, f'{name}.parquet')
+        pq.write_table(table, filepath, compression='zstd')
+    
+    return filepath
+
+
+def generate_sales_log(fmt='parquet'):
     """
-    Creates sales_log.csv with internal billing records.
+    Creates sales_log (Parquet by default, CSV for legacy consumers)
+    with internal billing records.
     Includes TXN-1005 (missing payment scenario).
     """
-    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-    os.makedirs(data_dir, exist_ok=True)
+    os.makedirs(DATA_DIR, exist_ok=True)
     
     sales_records = [
         ['txn_id', 'client', 'billed_amount', 'timestamp'],
@@ -34,22 +58,19 @@ def generate_sales_log():
         ['TXN-1010', 'Vortex Systems', 10500, '2025-12-10 17:20:00']
     ]
     
-    filepath = os.path.join(data_dir, 'sales_log.csv')
-    with open(filepath, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(sales_records)
+    filepath = write_dataset(sales_records, DATA_DIR, 'sales_log', fmt)
     
     print(f"✓ Generated: {filepath}")
     return filepath
 
 
-def generate_bank_feed():
+def generate_bank_feed(fmt='parquet'):
     """
-    Creates bank_feed.csv with external payment confirmations.
+    Creates bank_feed (Parquet by default, CSV for legacy consumers)
+    with external payment confirmations.
     Excludes TXN-1005 and introduces variance in TXN-1003.
     """
-    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-    os.makedirs(data_dir, exist_ok=True)
+    os.makedirs(DATA_DIR, exist_ok=True)
     
     bank_records = [
         ['txn_id', 'bank_ref', 'received_amount', 'settled_date'],
@@ -65,22 +86,24 @@ def generate_bank_feed():
         ['TXN-1010', 'BNK-REF-A010', 10500, '2025-12-10']
     ]
     
-    filepath = os.path.join(data_dir, 'bank_feed.csv')
-    with open(filepath, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(bank_records)
+    filepath = write_dataset(bank_records, DATA_DIR, 'bank_feed', fmt)
     
     print(f"✓ Generated: {filepath}")
     return filepath
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate Sentinel mock datasets.")
+    parser.add_argument('--format', choices=['parquet', 'csv'], default='parquet',
+                        help="output format (csv for legacy consumers)")
+    args = parser.parse_args()
+    
     print("\n" + "="*60)
     print("SENTINEL DATA GENERATOR | Initializing Mock Datasets")
     print("="*60 + "\n")
     
-    sales_path = generate_sales_log()
-    bank_path = generate_bank_feed()
+    sales_path = generate_sales_log(args.format)
+    bank_path = generate_bank_feed(args.format)
     
     print("\n" + "-"*60)
     print("ANOMALY INJECTION SUMMARY:")
@@ -4,7 +4,7 @@ SENTINEL: Automated Data Integrity Protocol
 Financial reconciliation engine for detecting payment discrepancies.
 
 Core Functions:
-- Missing Payment Detection (Left Join Analysis)
+- Missing Payment Detection (Anti-Join Analysis)
 - Revenue Variance Identification (Amount Mismatch)
 - Forensic Audit Report Generation
 
@@ -12,11 +12,45 @@ Author: Abhay
 Purpose: Learning Data Quality Automation
 """
 
+import numpy as np
 import pandas as pd
+import io
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    from numba import njit, prange, types
+except ImportError:  # Optional accelerator
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pa_csv
+except ImportError:  # Plain pandas install
+    pa_csv = None
+
+# Optional GPU backend (SENTINEL_BACKEND=cudf); cuDF mirrors the pandas API
+if os.environ.get('SENTINEL_BACKEND', 'pandas').lower() == 'cudf':
+    import cudf as xp
+else:
+    xp = pd
+
+# Stream the sales log in chunks of this many rows (0 = load it whole)
+SENTINEL_CHUNKSIZE = int(os.environ.get('SENTINEL_CHUNKSIZE', '0'))
+
+_LOG = logging.getLogger("sentinel")
+
+# Project paths (dataset paths are stems; .parquet or .csv is appended)
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+DATA_DIR = os.path.join(_ROOT, 'data')
+SALES_PATH = os.path.join(DATA_DIR, 'sales_log')
+BANK_PATH = os.path.join(DATA_DIR, 'bank_feed')
+REPORT_DIR = os.path.join(_ROOT, 'audit_reports')
+REPORT_PATH = os.path.join(REPORT_DIR, 'FORENSIC_REPORT.txt')
+
 
 # ============================================================================
 # LOGGING CONFIGURATION
@@ -26,7 +60,11 @@ def setup_logger():
     """
     Configures enterprise-grade logging system.
     Format: Timestamp | Module | Severity | Message
+    Idempotent: repeated calls reuse the installed handler.
     """
+    if _LOG.handlers:
+        return _LOG
+    
     log_format = '%(asctime)s | [SENTINEL-CORE] | %(levelname)s | %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
     
@@ -35,47 +73,201 @@ def setup_logger():
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(logging.Formatter(log_format, date_format))
     
-    # Root logger
-    logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
-    logger.addHandler(console_handler)
+    # Sentinel logger (kept off the root logger so caller configs don't compound)
+    _LOG.setLevel(logging.INFO)
+    _LOG.addHandler(console_handler)
+    _LOG.propagate = False
     
-    return logger
+    return _LOG
 
 
 # ============================================================================
 # DATA INGESTION MODULE
 # ============================================================================
 
-def load_datasets():
+# Columns actually used, with explicit dtypes (no inference at parse time);
+# any other column in the source files is never parsed
+SALES_DTYPES = {
+    'txn_id': 'string',
+    'client': 'string',
+    'billed_amount': 'float64',
+    'timestamp': 'string'
+}
+BANK_DTYPES = {
+    'txn_id': 'string',
+    'received_amount': 'float64'
+}
+
+
+def read_csv_fast(path, dtype):
+    """
+    Reads a CSV with Arrow's multithreaded reader, specialized to the fixed
+    schema (column types and projection set up front, no type inference).
+    Falls back to the default C parser on plain pandas installs.
+    """
+    if pa_csv is None:
+        return pd.read_csv(path, usecols=list(dtype), dtype=dtype)
+    
+    arrow_types = {'string': pa.string(), 'int64': pa.int64(), 'float64': pa.float64()}
+    convert_options = pa_csv.ConvertOptions(
+        column_types={col: arrow_types[kind] for col, kind in dtype.items()},
+        include_columns=list(dtype)
+    )
+    table = pa_csv.read_csv(path, convert_options=convert_options)
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype()}.get)
+
+
+def resolve_dataset(path_stem):
+    """
+    Picks the newer of <path_stem>.parquet and <path_stem>.csv, so a
+    regenerated or dropped-in file is never shadowed by a stale one.
+    """
+    candidates = [path_stem + ext for ext in ('.parquet', '.csv') if os.path.exists(path_stem + ext)]
+    if not candidates:
+        raise FileNotFoundError(f"No {path_stem}.parquet or {path_stem}.csv")
+    path = max(candidates, key=os.path.getmtime)
+    _LOG.info(f"Reading source: {path}")
+    return path
+
+
+def read_dataset(path, dtype):
+    """
+    Reads a .parquet or .csv dataset (see resolve_dataset).
+    Loads straight into GPU memory when the cuDF backend is active.
+    """
+    is_parquet = path.endswith('.parquet')
+    if xp is not pd:
+        if is_parquet:
+            return xp.read_parquet(path, columns=list(dtype))
+        return xp.read_csv(path, usecols=list(dtype), dtype=dtype)
+    if is_parquet:
+        return pd.read_parquet(path, columns=list(dtype), engine='pyarrow', dtype_backend='pyarrow')
+    return read_csv_fast(path, dtype)
+
+
+def read_dataset_chunks(path, dtype, chunksize):
+    """
+    Streams a .parquet or .csv dataset as DataFrames of chunksize rows.
+    The source is opened eagerly so a missing file fails at load time.
+    """
+    if path.endswith('.parquet'):
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=list(dtype))
+        return (batch.to_pandas(types_mapper=pd.ArrowDtype) for batch in batches)
+    return pd.read_csv(path, usecols=list(dtype), dtype=dtype, chunksize=chunksize)
+
+
+def to_cents(amounts):
+    """
+    Converts a dollar amount column to exact int64 cents.
+    Blank amounts stay null (pandas nullable Int64; cuDF int64 is nullable).
+    """
+    return (amounts * 100).round().astype('Int64' if xp is pd else 'int64')
+
+
+def format_dollars(cents, signed=False):
+    """
+    Formats an int64 cents column as '$1,234.56' strings in a single pass.
+    Null amounts render as 'N/A'.
+    """
+    template = '${:+,.2f}' if signed else '${:,.2f}'
+    formatted = list(map(template.format, cents.to_numpy(dtype=np.float64, na_value=np.nan) / 100))
+    for i in np.flatnonzero(cents.isna().to_numpy()):
+        formatted[i] = 'N/A'
+    return formatted
+
+
+def prepare_sales(sales_df):
+    """
+    Replaces billed_amount with int64 billed_cents.
+    """
+    sales_df['billed_cents'] = to_cents(sales_df.pop('billed_amount'))
+    return sales_df
+
+
+class IngestionError(Exception):
+    """
+    Raised when a streamed dataset fails to parse after load_datasets returned.
+    """
+
+
+class SalesStream:
+    """
+    Lazy, single-pass iterator over prepared sales chunks.
+    Parse failures surface as IngestionError; len() is the number of
+    records streamed so far (the full count once iteration finishes).
+    """
+    
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.records_read = 0
+    
+    def __iter__(self):
+        try:
+            for chunk in self._chunks:
+                chunk = prepare_sales(chunk)
+                self.records_read += len(chunk)
+                yield chunk
+        except Exception as e:
+            raise IngestionError(e) from e
+    
+    def __len__(self):
+        return self.records_read
+
+
+def load_datasets(chunksize=SENTINEL_CHUNKSIZE):
     """
     Loads sales and bank datasets into memory.
+    Dollar amounts are stored as nullable int64 cents (billed_cents / received_cents).
+    The bank feed is indexed by txn_id, with split settlements summed into
+    one row per txn_id; record order
+    is kept as-is since reconciliation probes by hash, not by position.
+    With a chunksize (pandas backend only), the sales log is returned as a
+    SalesStream of chunks so peak memory stays O(chunk + bank feed).
     Returns: (sales_df, bank_df) or (None, None) on failure
     """
-    logger = logging.getLogger()
-    
     try:
-        base_path = os.path.join(os.path.dirname(__file__), '..')
-        sales_path = os.path.join(base_path, 'data', 'sales_log.csv')
-        bank_path = os.path.join(base_path, 'data', 'bank_feed.csv')
+        _LOG.info("Initiating data ingestion protocol...")
+        sales_source = resolve_dataset(SALES_PATH)
+        bank_source = resolve_dataset(BANK_PATH)
         
-        logger.info("Initiating data ingestion protocol...")
+        # Read the bank feed on a worker thread while the sales log is read
+        # here; the Arrow/C parsers release the GIL, so the reads overlap
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            bank_future = pool.submit(read_dataset, bank_source, BANK_DTYPES)
+            
+            if chunksize and xp is pd:
+                sales_df = SalesStream(read_dataset_chunks(sales_source, SALES_DTYPES, chunksize))
+                _LOG.info(f"✓ Sales Log: streaming in chunks of {chunksize:,} records")
+            else:
+                sales_df = prepare_sales(read_dataset(sales_source, SALES_DTYPES))
+                _LOG.info(f"✓ Sales Log: {len(sales_df)} records loaded")
+            
+            bank_df = bank_future.result().set_index('txn_id')
+        bank_df['received_cents'] = to_cents(bank_df.pop('received_amount'))
+        _LOG.info(f"✓ Bank Feed: {len(bank_df)} records loaded")
         
-        sales_df = pd.read_csv(sales_path)
-        logger.info(f"✓ Sales Log: {len(sales_df)} records loaded")
-        
-        bank_df = pd.read_csv(bank_path)
-        logger.info(f"✓ Bank Feed: {len(bank_df)} records loaded")
+        if not bank_df.index.is_unique:
+            # Split/partial settlements: reconcile against the total received
+            # (unknown if any part of it is blank)
+            split = bank_df.index.duplicated(keep=False)
+            _LOG.warning(
+                f"⚠ Bank Feed: {split.sum()} split settlement record(s) across "
+                f"{bank_df.index[split].nunique()} txn_id(s); amounts summed"
+            )
+            received = bank_df['received_cents']
+            has_blank = received.isna().groupby(level=0, sort=False).any()
+            received_total = received.groupby(level=0, sort=False).sum().mask(has_blank)
+            bank_df = received_total.to_frame('received_cents')
         
         return sales_df, bank_df
     
     except FileNotFoundError as e:
-        logger.critical(f"Data source unavailable: {e}")
-        logger.critical("Execute generate_mock_data.py first")
+        _LOG.critical(f"Data source unavailable: {e}")
+        _LOG.critical("Execute generate_mock_data.py first")
         return None, None
     
     except Exception as e:
-        logger.critical(f"Ingestion failure: {e}")
+        _LOG.critical(f"Ingestion failure: {e}")
         return None, None
 
 
@@ -83,58 +275,138 @@ def load_datasets():
 # RECONCILIATION ENGINE
 # ============================================================================
 
-def detect_anomalies(sales_df, bank_df):
+if njit is not None:
+    # Eager signature; inputs are readonly because pandas hands out
+    # copy-on-write views of its column buffers.
+    _AMOUNTS = types.Array(types.int64, 1, 'A', readonly=True)
+
+    @njit(types.Tuple((types.int64[:], types.int64[:]))(_AMOUNTS, _AMOUNTS), cache=True, parallel=True)
+    def compute_variance(billed, received):
+        """
+        Fused subtract + mismatch scan over aligned amount arrays.
+        Returns: (variance, nonzero_indices)
+        """
+        variance = np.empty(billed.shape[0], dtype=np.int64)
+        for i in prange(billed.shape[0]):
+            variance[i] = billed[i] - received[i]
+        return variance, np.flatnonzero(variance)
+else:
+    def compute_variance(billed, received):
+        """
+        NumPy fallback when numba is unavailable.
+        Returns: (variance, nonzero_indices)
+        """
+        variance = billed - received
+        return variance, np.flatnonzero(variance)
+
+
+def scan_anomalies(sales_df, bank_df, xp=xp):
+    """
+    Reconciles one block of sales records against the full bank feed.
+    
+    xp is the DataFrame library the inputs live in (pandas or cudf).
+    Returns: (missing_payments, variance_records, matched_count)
+    """
+    # DETECTION 1: Missing Payments
+    if xp is pd:
+        # Single hash probe of the bank index (-1 where no bank record),
+        # i.e. Series.map without the NaN/float round-trip
+        bank_pos = bank_df.index.get_indexer(sales_df['txn_id'])
+        has_bank = bank_pos >= 0
+    else:
+        has_bank = sales_df['txn_id'].isin(bank_df.index)
+    missing_payments = sales_df.loc[~has_bank, ['txn_id', 'client', 'billed_cents', 'timestamp']]
+    
+    # DETECTION 2: Revenue Variance (matched records only; a blank billed or
+    # received amount is flagged with an unknown (null) variance)
+    if xp is pd:
+        matched = sales_df.loc[has_bank].assign(
+            received_cents=bank_df['received_cents'].array.take(bank_pos[has_bank])
+        )
+        incomplete = (matched['billed_cents'].isna() | matched['received_cents'].isna()).to_numpy()
+        variances, mismatch_idx = compute_variance(
+            matched['billed_cents'].to_numpy(dtype=np.int64, na_value=0),
+            matched['received_cents'].to_numpy(dtype=np.int64, na_value=0)
+        )
+        flagged_idx = np.union1d(mismatch_idx, np.flatnonzero(incomplete))
+        flagged_variances = pd.array(variances[flagged_idx], dtype='Int64')
+        flagged_variances[incomplete[flagged_idx]] = pd.NA
+        variance_records = matched.iloc[flagged_idx].assign(variance_cents=flagged_variances)
+    else:
+        # Keep the join and subtract/compare on the GPU; only flagged rows come back.
+        # cuDF's DataFrame.join has no on= support, so merge on the column
+        matched = sales_df.loc[has_bank].merge(bank_df.reset_index(), on='txn_id', how='inner')
+        variances = matched['billed_cents'] - matched['received_cents']
+        flagged = variances.astype(bool).fillna(True)
+        variance_records = matched.loc[flagged].assign(variance_cents=variances).to_pandas()
+        missing_payments = missing_payments.to_pandas()
+    
+    return missing_payments, variance_records, len(matched)
+
+
+def concat_chunks(parts):
     """
-    Performs left join to identify:
+    Concatenates per-chunk results (no copy for the single-frame case).
+    """
+    if len(parts) == 1:
+        return parts[0]
+    return pd.concat(parts) if parts else pd.DataFrame()
+
+
+def detect_anomalies(sales_df, bank_df, xp=xp):
+    """
+    Probes each sale's txn_id against the bank index to identify:
     1. Missing Payments (txn_id in Sales but not in Bank)
     2. Revenue Variance (billed_amount != received_amount)
     
+    sales_df may also be an iterable of chunks (see load_datasets).
     Returns: (missing_payments, variance_records)
     """
-    logger = logging.getLogger()
-    logger.info("Executing reconciliation algorithm...")
+    _LOG.info("Executing reconciliation algorithm...")
     
-    # Left join: Keep all sales records
-    merged = pd.merge(
-        sales_df,
-        bank_df,
-        on='txn_id',
-        how='left',
-        suffixes=('_sales', '_bank')
-    )
+    chunks = [sales_df] if isinstance(sales_df, xp.DataFrame) else sales_df
+    missing_parts, variance_parts = [], []
+    matched_count = 0
+    for chunk in chunks:
+        missing, variance, matched = scan_anomalies(chunk, bank_df, xp)
+        missing_parts.append(missing)
+        variance_parts.append(variance)
+        matched_count += matched
     
-    # DETECTION 1: Missing Payments
-    missing_payments = merged[merged['bank_ref'].isna()].copy()
+    missing_payments = concat_chunks(missing_parts)
+    variance_records = concat_chunks(variance_parts)
     
     if not missing_payments.empty:
-        logger.critical(f"⚠ ALERT: {len(missing_payments)} MISSING PAYMENT(S) DETECTED")
-        for _, row in missing_payments.iterrows():
-            logger.critical(
-                f"   → {row['txn_id']} | Client: {row['client']} | "
-                f"Billed: ${row['billed_amount']:,.2f} | STATUS: UNPAID"
-            )
+        _LOG.critical(f"⚠ ALERT: {len(missing_payments)} MISSING PAYMENT(S) DETECTED")
+        if _LOG.isEnabledFor(logging.CRITICAL):
+            for txn_id, client, billed in zip(
+                missing_payments['txn_id'],
+                missing_payments['client'],
+                format_dollars(missing_payments['billed_cents'])
+            ):
+                _LOG.critical(f"   → {txn_id} | Client: {client} | Billed: {billed} | STATUS: UNPAID")
     else:
-        logger.info("✓ No missing payments detected")
-    
-    # DETECTION 2: Revenue Variance
-    matched_records = merged[merged['bank_ref'].notna()].copy()
-    matched_records['variance'] = matched_records['billed_amount'] - matched_records['received_amount']
-    variance_records = matched_records[matched_records['variance'] != 0].copy()
+        _LOG.info("✓ No missing payments detected")
     
     if not variance_records.empty:
-        logger.warning(f"⚠ ALERT: {len(variance_records)} AMOUNT VARIANCE(S) DETECTED")
-        for _, row in variance_records.iterrows():
-            variance = row['variance']
-            logger.warning(
-                f"   → {row['txn_id']} | Billed: ${row['billed_amount']:,.2f} | "
-                f"Received: ${row['received_amount']:,.2f} | VARIANCE: ${variance:+,.2f}"
-            )
+        _LOG.warning(f"⚠ ALERT: {len(variance_records)} AMOUNT VARIANCE(S) DETECTED")
+        if _LOG.isEnabledFor(logging.WARNING):
+            for txn_id, billed, received, variance in zip(
+                variance_records['txn_id'],
+                format_dollars(variance_records['billed_cents']),
+                format_dollars(variance_records['received_cents']),
+                format_dollars(variance_records['variance_cents'], signed=True)
+            ):
+                _LOG.warning(
+                    f"   → {txn_id} | Billed: {billed} | "
+                    f"Received: {received} | VARIANCE: {variance}"
+                )
     else:
-        logger.info("✓ No amount variances detected")
+        _LOG.info("✓ No amount variances detected")
     
     # DETECTION 3: Perfect Matches (Control Validation)
-    perfect_matches = matched_records[matched_records['variance'] == 0]
-    logger.info(f"✓ {len(perfect_matches)} transaction(s) reconciled successfully")
+    perfect_matches = matched_count - len(variance_records)
+    _LOG.info(f"✓ {perfect_matches} transaction(s) reconciled successfully")
     
     return missing_payments, variance_records
 
@@ -148,84 +420,98 @@ def generate_forensic_report(sales_df, missing_payments, variance_records):
     Writes detailed audit findings to a system log file.
     Output: audit_reports/FORENSIC_REPORT.txt
     """
-    logger = logging.getLogger()
+    os.makedirs(REPORT_DIR, exist_ok=True)
     
-    report_dir = os.path.join(os.path.dirname(__file__), '..', 'audit_reports')
-    os.makedirs(report_dir, exist_ok=True)
+    # Assemble the report in memory, then flush it to disk in one write
+    buf = io.StringIO()
     
-    report_path = os.path.join(report_dir, 'FORENSIC_REPORT.txt')
+    # Header
+    buf.write("="*80 + "\n")
+    buf.write("SENTINEL FORENSIC AUDIT REPORT\n")
+    buf.write("Automated Data Integrity Protocol - Version 1.0\n")
+    buf.write("="*80 + "\n")
+    buf.write(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    buf.write(f"Total Transactions Analyzed: {len(sales_df)}\n")
+    buf.write("="*80 + "\n\n")
     
-    with open(report_path, 'w') as f:
-        # Header
-        f.write("="*80 + "\n")
-        f.write("SENTINEL FORENSIC AUDIT REPORT\n")
-        f.write("Automated Data Integrity Protocol - Version 1.0\n")
-        f.write("="*80 + "\n")
-        f.write(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Total Transactions Analyzed: {len(sales_df)}\n")
-        f.write("="*80 + "\n\n")
-        
-        # Section 1: Missing Payments
-        f.write("[CRITICAL FINDINGS] - MISSING PAYMENTS\n")
-        f.write("-"*80 + "\n")
-        if not missing_payments.empty:
-            f.write(f"Status: {len(missing_payments)} UNPAID TRANSACTION(S) IDENTIFIED\n\n")
-            for _, row in missing_payments.iterrows():
-                f.write(f"Transaction ID: {row['txn_id']}\n")
-                f.write(f"Client: {row['client']}\n")
-                f.write(f"Billed Amount: ${row['billed_amount']:,.2f}\n")
-                f.write(f"Billing Date: {row['timestamp']}\n")
-                f.write(f"Bank Confirmation: NOT FOUND\n")
-                f.write(f"Risk Level: HIGH - Potential Revenue Loss\n")
-                f.write("-"*80 + "\n")
-        else:
-            f.write("Status: ALL PAYMENTS ACCOUNTED FOR ✓\n")
-            f.write("-"*80 + "\n")
-        
-        f.write("\n")
-        
-        # Section 2: Revenue Variance
-        f.write("[WARNING FINDINGS] - AMOUNT DISCREPANCIES\n")
-        f.write("-"*80 + "\n")
-        if not variance_records.empty:
-            f.write(f"Status: {len(variance_records)} VARIANCE(S) DETECTED\n\n")
-            for _, row in variance_records.iterrows():
-                variance = row['variance']
-                f.write(f"Transaction ID: {row['txn_id']}\n")
-                f.write(f"Client: {row['client']}\n")
-                f.write(f"Billed Amount: ${row['billed_amount']:,.2f}\n")
-                f.write(f"Received Amount: ${row['received_amount']:,.2f}\n")
-                f.write(f"Variance: ${variance:+,.2f}\n")
-                f.write(f"Risk Level: MEDIUM - Revenue Leakage\n")
-                f.write("-"*80 + "\n")
-        else:
-            f.write("Status: NO AMOUNT DISCREPANCIES FOUND ✓\n")
-            f.write("-"*80 + "\n")
-        
-        f.write("\n")
-        
-        # Section 3: Executive Summary
-        f.write("[EXECUTIVE SUMMARY]\n")
-        f.write("-"*80 + "\n")
-        total_issues = len(missing_payments) + len(variance_records)
-        f.write(f"Total Issues Identified: {total_issues}\n")
-        f.write(f"  • Critical (Missing Payments): {len(missing_payments)}\n")
-        f.write(f"  • Warnings (Variance): {len(variance_records)}\n")
-        
-        if not missing_payments.empty:
-            total_unpaid = missing_payments['billed_amount'].sum()
-            f.write(f"\nPotential Revenue at Risk: ${total_unpaid:,.2f}\n")
-        
-        if not variance_records.empty:
-            total_leakage = variance_records['variance'].sum()
-            f.write(f"Revenue Leakage Detected: ${total_leakage:+,.2f}\n")
-        
-        f.write("\n" + "="*80 + "\n")
-        f.write("END OF REPORT\n")
-        f.write("="*80 + "\n")
+    # Section 1: Missing Payments
+    buf.write("[CRITICAL FINDINGS] - MISSING PAYMENTS\n")
+    buf.write("-"*80 + "\n")
+    if not missing_payments.empty:
+        buf.write(f"Status: {len(missing_payments)} UNPAID TRANSACTION(S) IDENTIFIED\n\n")
+        buf.write("".join(
+            f"Transaction ID: {txn_id}\n"
+            f"Client: {client}\n"
+            f"Billed Amount: {billed}\n"
+            f"Billing Date: {timestamp}\n"
+            "Bank Confirmation: NOT FOUND\n"
+            "Risk Level: HIGH - Potential Revenue Loss\n"
+            f"{'-'*80}\n"
+            for txn_id, client, billed, timestamp in zip(
+                missing_payments['txn_id'],
+                missing_payments['client'],
+                format_dollars(missing_payments['billed_cents']),
+                missing_payments['timestamp']
+            )
+        ))
+    else:
+        buf.write("Status: ALL PAYMENTS ACCOUNTED FOR ✓\n")
+        buf.write("-"*80 + "\n")
+    
+    buf.write("\n")
     
-    logger.info(f"✓ Forensic report written: {report_path}")
-    return report_path
+    # Section 2: Revenue Variance
+    buf.write("[WARNING FINDINGS] - AMOUNT DISCREPANCIES\n")
+    buf.write("-"*80 + "\n")
+    if not variance_records.empty:
+        buf.write(f"Status: {len(variance_records)} VARIANCE(S) DETECTED\n\n")
+        buf.write("".join(
+            f"Transaction ID: {txn_id}\n"
+            f"Client: {client}\n"
+            f"Billed Amount: {billed}\n"
+            f"Received Amount: {received}\n"
+            f"Variance: {variance}\n"
+            "Risk Level: MEDIUM - Revenue Leakage\n"
+            f"{'-'*80}\n"
+            for txn_id, client, billed, received, variance in zip(
+                variance_records['txn_id'],
+                variance_records['client'],
+                format_dollars(variance_records['billed_cents']),
+                format_dollars(variance_records['received_cents']),
+                format_dollars(variance_records['variance_cents'], signed=True)
+            )
+        ))
+    else:
+        buf.write("Status: NO AMOUNT DISCREPANCIES FOUND ✓\n")
+        buf.write("-"*80 + "\n")
+    
+    buf.write("\n")
+    
+    # Section 3: Executive Summary
+    buf.write("[EXECUTIVE SUMMARY]\n")
+    buf.write("-"*80 + "\n")
+    total_issues = len(missing_payments) + len(variance_records)
+    buf.write(f"Total Issues Identified: {total_issues}\n")
+    buf.write(f"  • Critical (Missing Payments): {len(missing_payments)}\n")
+    buf.write(f"  • Warnings (Variance): {len(variance_records)}\n")
+    
+    if not missing_payments.empty:
+        total_unpaid = missing_payments['billed_cents'].sum() / 100
+        buf.write(f"\nPotential Revenue at Risk: ${total_unpaid:,.2f}\n")
+    
+    if not variance_records.empty:
+        total_leakage = variance_records['variance_cents'].sum() / 100
+        buf.write(f"Revenue Leakage Detected: ${total_leakage:+,.2f}\n")
+    
+    buf.write("\n" + "="*80 + "\n")
+    buf.write("END OF REPORT\n")
+    buf.write("="*80 + "\n")
+    
+    with open(REPORT_PATH, 'w') as f:
+        f.write(buf.getvalue())
+    
+    _LOG.info(f"✓ Forensic report written: {REPORT_PATH}")
+    return REPORT_PATH
 
 
 # ============================================================================
@@ -236,39 +522,45 @@ def main():
     """
     Primary execution pipeline.
     """
-    logger = setup_logger()
+    setup_logger()
     
     print("\n" + "="*80)
     print("SENTINEL: AUTOMATED DATA INTEGRITY PROTOCOL")
     print("="*80 + "\n")
     
-    logger.info("System initialization complete")
-    logger.info("Commencing financial reconciliation sequence...")
+    _LOG.info("System initialization complete")
+    _LOG.info("Commencing financial reconciliation sequence...")
     
     # Step 1: Data Loading
     sales_df, bank_df = load_datasets()
     if sales_df is None or bank_df is None:
-        logger.critical("ABORT: Cannot proceed without valid datasets")
+        _LOG.critical("ABORT: Cannot proceed without valid datasets")
         return
     
     # Step 2: Anomaly Detection
-    logger.info("-" * 80)
-    missing_payments, variance_records = detect_anomalies(sales_df, bank_df)
+    _LOG.info("-" * 80)
+    try:
+        missing_payments, variance_records = detect_anomalies(sales_df, bank_df)
+    except IngestionError as e:
+        # Streamed sales chunks are parsed lazily, during reconciliation
+        _LOG.critical(f"Ingestion failure: {e}")
+        _LOG.critical("ABORT: Cannot proceed without valid datasets")
+        return
     
     # Step 3: Report Generation
-    logger.info("-" * 80)
-    logger.info("Generating forensic audit report...")
+    _LOG.info("-" * 80)
+    _LOG.info("Generating forensic audit report...")
     report_path = generate_forensic_report(sales_df, missing_payments, variance_records)
     
     # Final Status
-    logger.info("-" * 80)
+    _LOG.info("-" * 80)
     total_issues = len(missing_payments) + len(variance_records)
     
     if total_issues == 0:
-        logger.info("✓ AUDIT COMPLETE: All transactions reconciled successfully")
+        _LOG.info("✓ AUDIT COMPLETE: All transactions reconciled successfully")
     else:
-        logger.warning(f"⚠ AUDIT COMPLETE: {total_issues} issue(s) require attention")
-        logger.warning(f"Review report: {report_path}")
+        _LOG.warning(f"⚠ AUDIT COMPLETE: {total_issues} issue(s) require attention")
+        _LOG.warning(f"Review report: {report_path}")
     
     print("\n" + "="*80)
     print("SENTINEL PROTOCOL TERMINATED")